@@ -1,18 +1,21 @@
-import os, re, io, math, statistics, tempfile, threading, requests, urllib.parse
+import os, re, io, math, base64, asyncio, functools, threading, urllib.parse
 from datetime import datetime, timezone
 from dateutil import parser as dparser
+import numpy as np
 
 # PDF (ReportLab)
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Table, TableStyle, Spacer
 from reportlab.lib.units import inch
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
 
 # API
 from fastapi import FastAPI, Body
 from fastapi.responses import JSONResponse
 import uvicorn
+import uvloop
 
 # Telegram
 from telegram import Update, InputFile
@@ -30,42 +33,61 @@ if not BOT_TOKEN:
 # Rehab $/sf by condition + MAO tiers
 REHAB_PSF = {"excellent": 20.0, "fair": 42.5, "poor": 85.0}
 MAO_TIERS = [0.65, 0.70, 0.75]  # aggressive, standard, hot
+_TIER_INDEX = {"aggressive": 0, "standard": 1, "hot": 2}  # --mao name → MAO_TIERS index
 
 # -------------------------
 # Helpers
 # -------------------------
-def days_since(date_str):
-    d = dparser.parse(date_str).date()
-    return (datetime.now(timezone.utc).date() - d).days
-
-def score_comp(subj, comp):
-    days = comp["days_since_sale"]
-    bedDiff = abs((comp.get("beds") or 0) - (subj.get("beds") or 0))
-    bathDiff= abs((comp.get("baths") or 0) - (subj.get("baths") or 0))
-    yrDiff  = abs((comp.get("year") or 0) - (subj.get("year") or 0)) if subj.get("year") and comp.get("year") else 0
-    sizeTerm= abs(math.log((comp.get("sqft") or 1) / max(1, (subj.get("sqft") or 1))))
-    score = 100 - 20*min(days,365)/365 - 30*sizeTerm - 8*bedDiff - 10*bathDiff - 10*min(yrDiff,60)/60
-    return max(0, round(score))
-
-def comp_reasons(subj, comp):
+@functools.lru_cache(maxsize=4096)
+def _parse_date(date_str):
+    # portal dates are ISO-8601; only fall back to dateutil for anything else
+    try:
+        return datetime.fromisoformat(date_str).date()
+    except ValueError:
+        return dparser.parse(date_str).date()
+
+def days_since(date_str, today=None):
+    today = today or datetime.now(timezone.utc).date()
+    return (today - _parse_date(date_str)).days
+
+def _column(rows, key):
+    # missing/None fields read as 0, same as the `or 0` scalar lookups
+    return np.fromiter(((r.get(key) or 0) for r in rows), dtype=np.float64, count=len(rows))
+
+def score_comps(s_sqft, s_beds, s_baths, s_year, days, sqft, beds, baths, year):
+    """Score all comps at once; subject is scalars, comp arrays are one entry per comp."""
+    log_s_sqft = math.log(max(1, s_sqft or 1))
+    bedDiff = np.abs(beds - (s_beds or 0))
+    bathDiff= np.abs(baths - (s_baths or 0))
+    yrDiff  = np.where(year != 0, np.abs(year - s_year), 0) if s_year else np.zeros_like(year)
+    sizeTerm= np.abs(np.log(np.where(sqft != 0, sqft, 1)) - log_s_sqft)
+    score = 100 - 20*np.minimum(days,365)/365 - 30*sizeTerm - 8*bedDiff - 10*bathDiff - 10*np.minimum(yrDiff,60)/60
+    return np.clip(np.round(score), 0, None).astype(np.int64)
+
+def comp_reasons(s_sqft, s_beds, s_baths, comp):
     r=[]
-    if subj.get("sqft") and comp.get("sqft") and abs(comp["sqft"]-subj["sqft"])/subj["sqft"] <= 0.1: r.append("~size match")
-    if comp.get("beds")==subj.get("beds"): r.append("same beds")
-    if comp.get("baths")==subj.get("baths"): r.append("same baths")
+    if s_sqft and comp.get("sqft") and abs(comp["sqft"]-s_sqft)/s_sqft <= 0.1: r.append("~size match")
+    if comp.get("beds")==s_beds: r.append("same beds")
+    if comp.get("baths")==s_baths: r.append("same baths")
     if comp.get("days_since_sale")<=45: r.append(f'{comp["days_since_sale"]}d recent')
     return " • ".join(r[:3])
 
-def fetch_portal_comps(address:str):
+@functools.lru_cache(maxsize=1024)
+def _fetch_portal_comps_cached(address:str):
     """
     Stub data so flow deploys cleanly; replace with live fetchers later.
     """
-    return [
+    return (
         {"address":"17267 Ventana Dr, Boca Raton, FL 33487","sold_price":650000,"sold_date":"2025-06-30","beds":3,"baths":2,"sqft":1820,"year":1992},
         {"address":"17165 Balboa Point Way, Boca Raton, FL 33487","sold_price":800000,"sold_date":"2025-07-07","beds":3,"baths":2.5,"sqft":2304,"year":1992},
         {"address":"17357 Balboa Point Way, Boca Raton, FL 33487","sold_price":735000,"sold_date":"2025-03-07","beds":4,"baths":2,"sqft":2013,"year":1992},
-    ]
+    )
 
-def verify_true_cash(comp):
+async def fetch_portal_comps(address:str):
+    # callers mutate the rows, so hand out copies of the cached ones
+    return [dict(r) for r in _fetch_portal_comps_cached(address)]
+
+async def verify_true_cash(comp):
     # Hook for Clerk deed/mortgage check — returns Pending in MVP
     return {"cash_status":"Pending"}
 
@@ -95,74 +117,167 @@ def make_links(address: str):
 # -------------------------
 # PDF generator (ReportLab)
 # -------------------------
+# Fixed layout, computed once at import; the packet schema never changes,
+# so draw straight onto the canvas instead of running Platypus layout.
+_PAGE_W, _PAGE_H = A4
+_MARGIN  = 36
+_FRAME_W = _PAGE_W - 2*_MARGIN
+_PAD_X, _PAD_Y = 4, 3
+_INCH_0_1 = 0.1*inch
+_INCH_0_2 = 0.2*inch
+_COMP_HDR = ["Score","Address","Sold","Price","$/sf","Beds","Baths","Sqft","Why","Cash?"]
+_MAO_HDR  = ["Tier","Buyer Max","Your MAO (fee in)"]
+
+def _columns(widths, left):
+    cols, x = [], left
+    for w in widths:
+        cols.append((x, w))
+        x += w
+    return cols
+
+_COMP_COLS = _columns((28, 170, 48, 42, 28, 24, 28, 30, 90, 35), _MARGIN)  # sums to _FRAME_W
+_MAO_COLS  = _columns((40, 80, 100), (_PAGE_W - 220) / 2)                   # centered
+
+def _fmt_usd(x):
+    return f"${x:,.0f}"
+
+def _wrap_chars(text, font, size, width):
+    """Break text at any character (URLs have no spaces to split on)."""
+    lines, cur, cur_w = [], "", 0
+    for ch in text:
+        w = stringWidth(ch, font, size)
+        if cur and cur_w + w > width:
+            lines.append(cur)
+            cur, cur_w = "", 0
+        cur += ch
+        cur_w += w
+    return lines + [cur]
+
+def _draw_lines(cv, y, lines, font, size, leading, center=False):
+    cv.setFont(font, size)
+    for line in lines:
+        y -= leading
+        if center:
+            cv.drawCentredString(_PAGE_W/2, y + leading - size, line)
+        else:
+            cv.drawString(_MARGIN, y + leading - size, line)
+    return y
+
+# Heading3 look: bold-oblique 12/14, 12pt before, 6pt after
+_HEADING_BEFORE, _HEADING_LEADING, _HEADING_AFTER = 12, 14, 6
+_HEADING_H = _HEADING_BEFORE + _HEADING_LEADING + _HEADING_AFTER
+
+def _draw_heading(cv, y, text):
+    y = _draw_lines(cv, y - _HEADING_BEFORE, [text], "Helvetica-BoldOblique", 12, _HEADING_LEADING)
+    return y - _HEADING_AFTER
+
+def _draw_link(cv, y, label, url):
+    lines = _wrap_chars(f"{label}{url}", "Helvetica", 10, _FRAME_W)
+    y_end = _draw_lines(cv, y, lines, "Helvetica", 10, 12)
+    cv.linkURL(url, (_MARGIN, y_end, _MARGIN + _FRAME_W, y), relative=0)
+    return y_end
+
+def _cell_lines(text, size, width):
+    if stringWidth(text, "Helvetica", size) <= width:
+        return [text]
+    return simpleSplit(text, "Helvetica", size, width) or [""]
+
+def _row_height(size, n_lines=1):
+    return n_lines * size * 1.2 + 2*_PAD_Y
+
+def _draw_table(cv, y, cols, rows, size):
+    """Grid table with a shaded header row that repeats on page breaks."""
+    leading = size * 1.2
+    left, width = cols[0][0], sum(w for _, w in cols)
+    edges = [x for x, _ in cols] + [left + width]
+
+    def layout(row):
+        cells = [_cell_lines(str(v), size, w - 2*_PAD_X) for v, (_, w) in zip(row, cols)]
+        return cells, _row_height(size, max(len(l) for l in cells))
+
+    def draw_row(y, cells, h):
+        for (x, _), lines in zip(cols, cells):
+            # vertically centered, like VALIGN MIDDLE
+            ty = y - (h - len(lines)*leading) / 2 - size
+            for line in lines:
+                cv.drawString(x + _PAD_X, ty, line)
+                ty -= leading
+        return y - h
+
+    def start_page(y):
+        cv.setFillColor(colors.lightgrey)
+        cv.rect(left, y - hdr_h, width, hdr_h, stroke=0, fill=1)
+        cv.setFillColor(colors.black)
+        cv.setFont("Helvetica", size)
+        return [y], draw_row(y, hdr_cells, hdr_h)
+
+    def end_page(rules):
+        # one stroke per row boundary plus the column edges, not a box per cell
+        cv.setStrokeColor(colors.grey)
+        cv.setLineWidth(0.25)
+        top, bottom = rules[0], rules[-1]
+        cv.lines([(left, r, left + width, r) for r in rules] + [(x, top, x, bottom) for x in edges])
+
+    hdr_cells, hdr_h = layout(rows[0])
+    rules, y = start_page(y)
+    rules.append(y)
+    for row in rows[1:]:
+        cells, h = layout(row)
+        if y - h < _MARGIN:
+            end_page(rules)
+            cv.showPage()
+            rules, y = start_page(_PAGE_H - _MARGIN)
+            rules.append(y)
+        y = draw_row(y, cells, h)
+        rules.append(y)
+    end_page(rules)
+    return y
+
 def generate_pdf(subject, comps, arv, condition, rehab_cost, assignment_fee, mao_rows, dispo_price):
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    doc = SimpleDocTemplate(tmp.name, pagesize=A4, title="Comp Packet")
-    styles = getSampleStyleSheet()
-    story = []
+    buf = io.BytesIO()
+    cv = canvas.Canvas(buf, pagesize=A4)
+    cv.setTitle("Comp Packet")
 
     title = f"Comp Packet – {subject['address']}"
     sub = f"{subject.get('beds','')} bd • {subject.get('baths','')} ba • {subject.get('sqft','')} sqft • Yr {subject.get('year','—')}"
-    meta = f"Condition: {condition.title()} • Assignment Fee: ${assignment_fee:,.0f}"
-    summary = f"ARV: ${arv:,.0f} • Rehab: ${rehab_cost:,.0f} • Dispo Ask: ${dispo_price:,.0f}"
+    meta = f"Condition: {condition.title()} • Assignment Fee: {_fmt_usd(assignment_fee)}"
+    summary = f"ARV: {_fmt_usd(arv)} • Rehab: {_fmt_usd(rehab_cost)} • Dispo Ask: {_fmt_usd(dispo_price)}"
 
     zillow_url, county_url = make_links(subject["address"])
 
-    story += [
-        Paragraph(title, styles['Title']),
-        Paragraph(sub, styles['Normal']),
-        Paragraph(meta, styles['Normal']),
-        Spacer(1, 0.1*inch),
-        Paragraph(f"🔗 Zillow: <a href='{zillow_url}'>{zillow_url}</a>", styles['Normal']),
-        Paragraph(f"🏛 County Appraiser: <a href='{county_url}'>{county_url}</a>", styles['Normal']),
-        Spacer(1, 0.2*inch),
-        Paragraph(summary, styles['Heading3']),
-        Spacer(1, 0.2*inch),
-        Paragraph("Comps", styles['Heading3'])
-    ]
-
-    comp_hdr = ["Score","Address","Sold","Price","$/sf","Beds","Baths","Sqft","Why","Cash?"]
-    comp_rows = [comp_hdr]
-    for c in comps:
-        comp_rows.append([
-            c.get("score",""),
-            c.get("address",""),
-            c.get("sold_date",""),
-            f"${c.get('sold_price',0):,.0f}",
-            f"${(c.get('ppsf') or 0):,.0f}",
-            c.get("beds",""), c.get("baths",""), f"{c.get('sqft',''):,}" if c.get("sqft") else "",
-            c.get("why",""), c.get("cash_status","")
-        ])
-    t = Table(comp_rows, repeatRows=1)
-    t.setStyle(TableStyle([
-        ("BACKGROUND",(0,0),(-1,0), colors.lightgrey),
-        ("GRID",(0,0),(-1,-1), 0.25, colors.grey),
-        ("VALIGN",(0,0),(-1,-1),"MIDDLE"),
-        ("FONTSIZE",(0,0),(-1,-1),8),
-    ]))
-    story += [t, Spacer(1, 0.2*inch), Paragraph("MAO Tiers", styles['Heading3'])]
-
-    mao_hdr = ["Tier","Buyer Max","Your MAO (fee in)"]
-    mao_rows_tbl = [mao_hdr] + [[r["tier"], f"${r['buyer_max']:,.0f}", f"${r['your_mao']:,.0f}"] for r in mao_rows]
-    t2 = Table(mao_rows_tbl, repeatRows=1)
-    t2.setStyle(TableStyle([
-        ("BACKGROUND",(0,0),(-1,0), colors.lightgrey),
-        ("GRID",(0,0),(-1,-1), 0.25, colors.grey),
-        ("VALIGN",(0,0),(-1,-1),"MIDDLE"),
-        ("FONTSIZE",(0,0),(-1,-1),9),
-    ]))
-    story.append(t2)
-
-    doc.build(story)
-    return tmp.name
+    y = _PAGE_H - _MARGIN
+    y = _draw_lines(cv, y, simpleSplit(title, "Helvetica-Bold", 18, _FRAME_W), "Helvetica-Bold", 18, 22, center=True) - 6
+    y = _draw_lines(cv, y, [sub, meta], "Helvetica", 10, 12) - _INCH_0_1
+    y = _draw_link(cv, y, "🔗 Zillow: ", zillow_url)
+    y = _draw_link(cv, y, "🏛 County Appraiser: ", county_url) - _INCH_0_2
+    y = _draw_heading(cv, y, summary) - _INCH_0_2
+    y = _draw_heading(cv, y, "Comps")
+
+    # comps arrive normalized from _run_comps_impl (score/ppsf/why/cash_status set, sqft non-zero)
+    comp_rows = [_COMP_HDR] + [[
+        c["score"], c["address"], c["sold_date"],
+        _fmt_usd(c["sold_price"]), _fmt_usd(c["ppsf"]),
+        c.get("beds",""), c.get("baths",""), f"{c['sqft']:,}",
+        c["why"], c["cash_status"],
+    ] for c in comps]
+    y = _draw_table(cv, y, _COMP_COLS, comp_rows, 8) - _INCH_0_2
+
+    mao_rows_tbl = [_MAO_HDR] + [[r["tier"], _fmt_usd(r["buyer_max"]), _fmt_usd(r["your_mao"])] for r in mao_rows]
+    # keep the MAO heading with its (single-line-row) table
+    if y - _HEADING_H - len(mao_rows_tbl)*_row_height(9) < _MARGIN:
+        cv.showPage()
+        y = _PAGE_H - _MARGIN
+    y = _draw_heading(cv, y, "MAO Tiers")
+    _draw_table(cv, y, _MAO_COLS, mao_rows_tbl, 9)
+
+    cv.showPage()
+    cv.save()
+    return buf.getvalue()
 
 # -------------------------
-# FastAPI (internal API)
+# Comps pipeline
 # -------------------------
-api = FastAPI()
-
-@api.post("/run_comps")
-def run_comps(payload=Body(...)):
+async def _run_comps_impl(payload):
     address = payload["address"]
     condition = (payload.get("condition") or "fair").lower()            # default: fair
     assignment_fee = int(payload.get("assignment_fee") or 20000)        # default: 20000
@@ -176,25 +291,36 @@ def run_comps(payload=Body(...)):
         "sqft": int(so.get("sqft") or 1627),
         "year": int(so.get("year") or 1992),
     }
-
-    raw = fetch_portal_comps(address)
-    comps=[]
-    for r in raw:
-        r["days_since_sale"]=days_since(r["sold_date"])
-        r["ppsf"] = r["sold_price"]/r["sqft"] if r.get("sqft") else None
-        r["score"]=score_comp(subject, r)
-        r["why"]=comp_reasons(subject, r)
-        r.update(verify_true_cash(r))
-        comps.append(r)
-
-    comps = [c for c in comps if c.get("ppsf")]
-    comps.sort(key=lambda x:(-x["score"], x["days_since_sale"]))
-
-    median_ppsf = statistics.median([c["ppsf"] for c in comps])
-    arv = round(median_ppsf * (subject["sqft"] or 0))
+    # read the subject once; everything below works off these locals
+    s_sqft, s_beds, s_baths, s_year = subject["sqft"], subject["beds"], subject["baths"], subject["year"]
+
+    raw = await fetch_portal_comps(address)
+    today = datetime.now(timezone.utc).date()
+    days  = np.fromiter((days_since(r["sold_date"], today) for r in raw), dtype=np.int64, count=len(raw))
+    price = _column(raw, "sold_price")
+    sqft  = _column(raw, "sqft")
+    ppsf  = np.divide(price, sqft, out=np.zeros_like(price), where=sqft != 0)
+    score = score_comps(s_sqft, s_beds, s_baths, s_year, days, sqft, _column(raw, "beds"), _column(raw, "baths"), _column(raw, "year"))
+
+    # drop comps without a usable $/sf, then order by score desc, recency asc
+    keep  = np.flatnonzero(ppsf)
+    order = keep[np.lexsort((days[keep], -score[keep]))]
+
+    comps = [raw[i] for i in order]
+    # per-comp clerk lookups run concurrently: wall time is the slowest one, not the sum
+    cash = await asyncio.gather(*(verify_true_cash(r) for r in comps))
+    for i, r, cs in zip(order, comps, cash):
+        r["days_since_sale"]=int(days[i])
+        r["ppsf"]=float(ppsf[i])
+        r["score"]=int(score[i])
+        r["why"]=comp_reasons(s_sqft, s_beds, s_baths, r)
+        r.update(cs)
+
+    median_ppsf = float(np.median(ppsf[keep]))
+    arv = round(median_ppsf * s_sqft)
 
     rehab_psf = REHAB_PSF.get(condition, REHAB_PSF["fair"])
-    rehab_cost = round((subject["sqft"] or 0) * rehab_psf)
+    rehab_cost = round(s_sqft * rehab_psf)
 
     mao_rows=[]
     for t in MAO_TIERS:
@@ -203,32 +329,56 @@ def run_comps(payload=Body(...)):
         mao_rows.append({"tier": f"{int(t*100)}%", "buyer_max": buyer_max, "your_mao": your_mao})
 
     cash_ppsf = median_ppsf * 0.95
-    dispo_price = round(cash_ppsf * (subject["sqft"] or 0))
+    dispo_price = round(cash_ppsf * s_sqft)
 
-    tier_map = {"aggressive":"65%", "standard":"70%", "hot":"75%"}
-    highlight_label = tier_map.get(highlight, "65%")
-    highlight_idx = {"65%":0, "70%":1, "75%":2}[highlight_label]
-    highlight_mao = mao_rows[highlight_idx]["your_mao"]
+    highlight_row = mao_rows[_TIER_INDEX.get(highlight, 0)]
+    highlight_label = highlight_row["tier"]
+    highlight_mao = highlight_row["your_mao"]
 
-    pdf_path = generate_pdf(subject, comps, arv, condition, rehab_cost, assignment_fee, mao_rows, dispo_price)
+    # ReportLab is blocking; keep it off the event loop
+    pdf = await asyncio.to_thread(
+        generate_pdf, subject, comps, arv, condition, rehab_cost, assignment_fee, mao_rows, dispo_price
+    )
     summary = (
         f"ARV ${arv:,} • Rehab ({condition}) ${rehab_cost:,} • "
         f"{highlight_label} MAO ${highlight_mao:,} • Dispo ${dispo_price:,}"
     )
-    return JSONResponse({"pdf_path": pdf_path, "summary": summary})
+    return {"pdf": pdf, "summary": summary}
+
+# -------------------------
+# FastAPI (internal API)
+# -------------------------
+api = FastAPI()
+
+@api.post("/run_comps")
+async def run_comps(payload=Body(...)):
+    data = await _run_comps_impl(payload)
+    return JSONResponse({
+        "pdf_base64": base64.b64encode(data["pdf"]).decode("ascii"),
+        "summary": data["summary"],
+    })
 
 def run_api():
-    uvicorn.run(api, host="0.0.0.0", port=PORT)
+    uvicorn.run(
+        api, host="0.0.0.0", port=PORT,
+        loop="uvloop", http="httptools",
+        log_level="warning", access_log=False
+    )
 
 # -------------------------
 # Telegram Bot
 # -------------------------
+_FLAG_RE = re.compile(
+    r"--(?P<k>fee|condition|beds|baths|sqft|year|mao)\s+(?P<v>[^\-][\S ]*?)(?=\s--|$)", re.I
+)
+_STRIP_RE = re.compile(r"--\w+\s+[^\-][\S ]*?(?=\s--|$)")
+
 def _parse_flags(text:str):
     out={}
     # optional flags; if missing, defaults apply (aggressive/fair/20000)
-    for k in ["fee","condition","beds","baths","sqft","year","mao"]:
-        m=re.search(rf"--{k}\s+([^\-][\S ]+?)(?=\s--|$)", text, re.I)
-        if m: out[k.lower()]=m.group(1).strip()
+    # single scan; first occurrence of a repeated flag wins
+    for m in _FLAG_RE.finditer(text):
+        out.setdefault(m["k"].lower(), m["v"].strip())
     return out
 
 async def comp_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -244,7 +394,7 @@ async def comp_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
     addr_and_flags = parts[1]
     fl = _parse_flags(addr_and_flags)
 
-    address = re.sub(r"--\w+\s+[^\-][\S ]+?(?=\s--|$)", "", addr_and_flags).strip().rstrip(",")
+    address = _STRIP_RE.sub("", addr_and_flags).strip().rstrip(",")
     if not address:
         await update.message.reply_text("Please include an address after /comp.")
         return
@@ -271,15 +421,13 @@ async def comp_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
         }
     }
 
-    base = f"http://127.0.0.1:{PORT}"
-    r = requests.post(f"{base}/run_comps", json=payload, timeout=60)
-    data = r.json()
+    # Call the pipeline in-process rather than looping back through the API
+    data = await _run_comps_impl(payload)
 
-    pdf_path = data.get("pdf_path")
-    with open(pdf_path, "rb") as f:
-        b = io.BytesIO(f.read())
-        b.name = "comps_report.pdf"
-        await context.bot.send_document(chat_id=update.effective_chat.id, document=InputFile(b))
+    await context.bot.send_document(
+        chat_id=update.effective_chat.id,
+        document=InputFile(data["pdf"], filename="comps_report.pdf"),
+    )
 
     if "summary" in data:
         await update.message.reply_text(data["summary"])
@@ -295,25 +443,15 @@ async def about_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_markdown_v2(msg)
 
 def run_bot():
-    # Clear webhook and cloud session; drop pending updates to avoid conflicts
-    try:
-        requests.get(
-            f"https://api.telegram.org/bot{BOT_TOKEN}/deleteWebhook",
-            params={"drop_pending_updates": "true"},
-            timeout=10
-        )
-        requests.get(
-            f"https://api.telegram.org/bot{BOT_TOKEN}/logOut",
-            timeout=10
-        )
-    except Exception:
-        pass
+    # libuv-based loop for PTB as well
+    uvloop.install()
 
     application = ApplicationBuilder().token(BOT_TOKEN).build()
     application.add_handler(CommandHandler("comp", comp_cmd))
     application.add_handler(CommandHandler("about", about_cmd))
 
-    # Start polling; PTB manages the loop
+    # Start polling; PTB manages the loop and clears any webhook
+    # (drop_pending_updates → deleteWebhook) on its own client before polling
     application.run_polling(
         allowed_updates=Update.ALL_TYPES,
         drop_pending_updates=True,